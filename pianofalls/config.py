@@ -1,5 +1,24 @@
-import json, hashlib
-import os, sys
+import copy, json, hashlib, mmap
+import os, sys, pathlib, itertools
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data):
+    """Encode config data as indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 if sys.platform == 'win32':
@@ -10,7 +29,7 @@ else:
 
 default_config = {
     "search_paths": ["~/Downloads"],
-    "songs": [],
+    "songs": {},  # sha: song config
     "rpi_display": None,  
         # {"ip_address": "10.10.10.10", "port": 1337, "udp": False, 
         #  "resolution": [64, 512], "bounds": [10, 501]},
@@ -24,6 +43,7 @@ default_song_config = {
     "zoom": 1.0,
     "loops": [],
 }
+default_song_config_items = tuple(default_song_config.items())
 
 
 class Config:
@@ -38,23 +58,62 @@ class Config:
 
     def __init__(self, filename):
         self.config_file = filename
-        self.songs_by_sha = {}
         self.load()
 
     def load(self):
-        if not os.path.exists(self.config_file):
-            with open(self.config_file, 'w') as f:
-                f.write(json.dumps(default_config, indent=4))
+        path = pathlib.Path(self.config_file)
+        if not path.exists():
+            path.write_bytes(_dumps(default_config))
         try:
-            with open(self.config_file) as f:
-                self.data = json.load(f)
+            self.data = _loads(path.read_bytes())
         except Exception as e:
             print(f"Error loading config file {self.config_file}: {e}")
-            self.data = default_config
+            self.data = copy.deepcopy(default_config)
+        # path: (mtime_ns, size, sha); persisted so files are not rehashed on every run
+        self._sha_cache = {
+            path: tuple(entry) for path, entry in self.data.get('sha_cache', {}).items()
+            if not self._is_removed(path)
+        }
+
+        # songs are stored keyed by sha; older configs stored a list
+        songs = self.data.get('songs', {})
+        if isinstance(songs, list):
+            songs_list, songs = songs, {}
+            # entries that can't be keyed by sha (missing or duplicate) are kept aside
+            # rather than discarded, so their settings are not lost
+            legacy_songs = []
+            for song in songs_list:
+                if song.get('sha') and song['sha'] not in songs:
+                    songs[song['sha']] = song
+                else:
+                    legacy_songs.append(song)
+            if legacy_songs:
+                self.data.setdefault('legacy_songs', []).extend(legacy_songs)
+                print(f"Config file {self.config_file}: {len(legacy_songs)} song entries with a missing or "
+                      "duplicate sha were moved to 'legacy_songs'")
+        for song in songs.values():
+            for key, value in default_song_config_items:
+                if key not in song:
+                    song[key] = copy.deepcopy(value)  # don't share mutable defaults between songs
+        self.data['songs'] = songs
+        self.songs_by_sha = songs
+
+    @staticmethod
+    def _is_removed(path):
+        """Return True if *path* was moved or deleted, so its cached hash can be forgotten.
+
+        Files whose directory is also missing (e.g. on an unmounted drive) are assumed to
+        still exist, so they are not rehashed when the drive comes back.
+        """
+        return not os.path.exists(path) and os.path.isdir(os.path.dirname(path))
 
     def save(self):
-        with open(self.config_file, 'w') as f:
-            json.dump(self.data, f, indent=4)
+        self.data['sha_cache'] = {path: list(entry) for path, entry in self._sha_cache.items()}
+        # write to a temporary file first so that a crash can't leave a truncated config
+        tmp_file = self.config_file + '.tmp'
+        with open(tmp_file, 'wb') as f:
+            f.write(_dumps(self.data))
+        os.replace(tmp_file, self.config_file)
 
     def __getitem__(self, key):
         return self.data[key]
@@ -68,10 +127,80 @@ class Config:
         return self.songs_by_sha.get(sha, {})
     
     def get_sha(self, filename):
-        data = open(filename, 'rb').read()
-        sha = hashlib.sha1()
-        sha.update(data)
-        return sha.hexdigest()
+        """Return the SHA1 hex digest of a file.
+
+        Results are cached (and saved with the config) until the file's size or
+        modification time changes.
+        """
+        stat = os.stat(filename)
+        path = os.path.abspath(filename)
+        mtime_ns, size, digest = self._sha_cache.get(path, (None, None, None))
+        if (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size):
+            with open(filename, 'rb') as f:
+                mapped = None
+                if stat.st_size >= 1 << 20:
+                    # large files are hashed straight from the page cache, without copying
+                    # them into read buffers
+                    try:
+                        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except OSError:
+                        pass  # not mappable (e.g. some network filesystems); read instead
+                if mapped is not None:
+                    with mapped:
+                        digest = hashlib.sha1(mapped).hexdigest()
+                elif hasattr(hashlib, 'file_digest'):
+                    # python >= 3.11: reads into a reused buffer and hashes in one helper
+                    digest = hashlib.file_digest(f, 'sha1').hexdigest()
+                else:
+                    sha = hashlib.sha1()
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        sha.update(chunk)
+                    digest = sha.hexdigest()
+            self._sha_cache[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def rehash_all(self, filenames):
+        """Compute the SHA1 of many files in parallel and save the results with the config.
+
+        Return a dict mapping each filename to its digest, or to None if the file
+        could not be read. Hashing releases the GIL, so threads can hash several
+        files at once.
+        """
+        filenames = iter(filenames)
+        digests = {}
+        workers = os.cpu_count() or 1
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                # submit a bounded batch at a time rather than queueing every file at once
+                while True:
+                    batch = list(itertools.islice(filenames, workers * 4))
+                    if not batch:
+                        break
+                    digests.update(zip(batch, ex.map(self._try_get_sha, batch)))
+        finally:
+            # keep whatever was hashed even if the run is interrupted
+            self.save()
+        return digests
+
+    def _try_get_sha(self, filename):
+        try:
+            return self.get_sha(filename)
+        except OSError as e:
+            print(f"Error hashing file {filename}: {e}")
+            return None
+
+class _LazyConfig:
+    """Stands in for the global Config, which is only loaded (and the config file
+    created) when it is first used rather than on import.
+    """
+    def __getattr__(self, name):
+        return getattr(Config.get_config(), name)
+
+    def __getitem__(self, key):
+        return Config.get_config()[key]
+
+    def __setitem__(self, key, value):
+        Config.get_config()[key] = value
 
 
-config = Config.get_config()
+config = _LazyConfig()
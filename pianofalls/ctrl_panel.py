@@ -16,32 +16,30 @@ class CtrlPanel(QtWidgets.QWidget):
         self.load_button = QtWidgets.QPushButton('Load')
         self.layout.addWidget(self.load_button)
 
-        self.speed_label = QtWidgets.QLabel('Speed:')
-        self.speed_label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-        self.layout.addWidget(self.speed_label)
-        self.speed_spin = QtWidgets.QSpinBox(
-            minimum=1, maximum=1000, singleStep=10, value=100, suffix='%'
-        )
-        self.layout.addWidget(self.speed_spin)
-
-        self.zoom_label = QtWidgets.QLabel('Zoom:')
-        self.zoom_label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
-        self.layout.addWidget(self.zoom_label)
-        self.zoom_spin = QtWidgets.QSpinBox(
-            minimum=1, maximum=1000, singleStep=10, value=100, suffix='%'
-        )
-        self.layout.addWidget(self.zoom_spin)
+        self.speed_spin = self._add_spin('Speed:')
+        self.zoom_spin = self._add_spin('Zoom:')
 
         self.load_button.clicked.connect(self.on_load)
         self.speed_spin.valueChanged.connect(self.on_speed_changed)
         self.zoom_spin.valueChanged.connect(self.on_zoom_changed)
 
+    def _add_spin(self, label, minimum=1, maximum=1000, step=10, value=100, suffix='%'):
+        """Add a labeled spin box to the panel and return the spin box"""
+        label = QtWidgets.QLabel(label)
+        label.setAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        self.layout.addWidget(label)
+        spin = QtWidgets.QSpinBox(
+            minimum=minimum, maximum=maximum, singleStep=step, value=value, suffix=suffix
+        )
+        self.layout.addWidget(spin)
+        return spin
+
     def on_load(self):
         mw = self.window()
-        if mw.last_filename is not None:
-            path = os.path.dirname(mw.last_filename)
+        path = os.path.dirname(mw.last_filename) if mw.last_filename is not None else ''
         filename, _ = QtWidgets.QFileDialog.getOpenFileName(self, 'Open File', path, 'MIDI Files (*.mid);;MusicXML Files (*.xml)')
-        mw.load(filename)
+        if filename:  # empty if the dialog was cancelled
+            mw.load(filename)
 
     def on_speed_changed(self, value):
         self.speed_changed.emit(value / 100)
@@ -3,6 +3,9 @@ import pathlib
 from .qt import QtCore, QtWidgets
 
 
+music_suffixes = ('.mid', '.midi', '.mxl', '.xml', '.musicxml')
+
+
 class FileTree(QtWidgets.QTreeWidget):
 
     file_double_clicked = QtCore.Signal(str)
@@ -17,8 +20,14 @@ class FileTree(QtWidgets.QTreeWidget):
         self.setSortingEnabled(True)
         self.itemChanged.connect(self.on_item_changed)
 
+        # column resizing is coalesced so that adding many roots resizes only once
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(lambda: self.resizeColumnToContents(0))
+
     def on_item_double_clicked(self, item, column):
-        if item.path.is_file():
+        if not item.is_dir:
             self.file_double_clicked.emit(str(item.path))
 
     def set_roots(self, roots):
@@ -33,7 +42,7 @@ class FileTree(QtWidgets.QTreeWidget):
         item = FileTreeItem(path)
         self.addTopLevelItem(item)
         item.setExpanded(True)
-        self.resizeColumnToContents(0)
+        self._resize_timer.start()
 
     def on_item_expanded(self, item):
         item.load_children()
@@ -44,20 +53,38 @@ class FileTree(QtWidgets.QTreeWidget):
             new_name = item.text(0)
             new_path = item.path.with_name(new_name)
             item.path.rename(new_path)
-            item.path = new_path
+            item.update_paths(new_path)
 
 class FileTreeItem(QtWidgets.QTreeWidgetItem):
-    def __init__(self, path):
+    def __init__(self, path, is_dir=None):
         super().__init__()
         self.path = path
         self.setText(0, path.parts[-1])
         flags = self.flags() | QtCore.Qt.ItemFlag.ItemIsEditable
-        if self.path.is_dir():
-            self._loading_item = QtWidgets.QTreeWidgetItem(['loading..'])
-            self.addChild(self._loading_item)
+        if is_dir is None:
+            is_dir = self.path.is_dir()
+        self.is_dir = is_dir
+        if is_dir:
+            # show an expand arrow without creating a placeholder child; the
+            # directory is only listed when the item is first expanded
+            self.setChildIndicatorPolicy(self.ChildIndicatorPolicy.ShowIndicator)
         self.setFlags(flags)
         self._children_loaded = False
 
+    def update_paths(self, new_path):
+        """Set the path of this item after it was renamed or moved, and update the
+        paths of any children that have already been loaded.
+        """
+        old_str, new_str = str(self.path), str(new_path)
+        self.path = new_path
+        # only the prefix changes, so descendants are updated by string substitution
+        # rather than with relative_to() for each one
+        stack = [self.child(i) for i in range(self.childCount())]
+        while stack:
+            item = stack.pop()
+            item.path = pathlib.Path(new_str + str(item.path)[len(old_str):])
+            stack.extend(item.child(i) for i in range(item.childCount()))
+
     def __lt__(self, other):
         if isinstance(other, FileTreeItem):
             return self.path < other.path
@@ -67,11 +94,16 @@ class FileTreeItem(QtWidgets.QTreeWidgetItem):
         if self._children_loaded:
             return
         self._children_loaded = True
-        if not self.path.is_dir():
+        if not self.is_dir:
             return
-        
-        self.removeChild(self._loading_item)
-        for child in sorted(self.path.iterdir()):
-            if child.is_dir() or child.suffix in ['.mid', '.midi', '.mxl', '.xml', '.musicxml']:
-                item = FileTreeItem(child)
-                self.addChild(item)
+        self.setChildIndicatorPolicy(self.ChildIndicatorPolicy.DontShowIndicatorWhenChildless)
+        # scandir gets the file type along with each name, so no extra stat() per child is needed
+        with os.scandir(self.path) as entries:
+            entries = sorted(entries, key=lambda entry: os.path.normcase(entry.name))
+        items = []
+        for entry in entries:
+            is_dir = entry.is_dir()
+            if is_dir or entry.name.lower().endswith(music_suffixes):
+                items.append(FileTreeItem(pathlib.Path(entry.path), is_dir=is_dir))
+        # insert all children at once rather than notifying the view once per child
+        self.addChildren(items)
@@ -1,14 +1,49 @@
-from .qt import QtWidgets, RectItem, Color, Brush
+import math
+import numpy as np
+from .qt import QtCore, QtGui, QtWidgets, Color, cached_pen, cached_brush
 
 
 class Keyboard(QtWidgets.QGraphicsWidget):
+    """Draws a piano keyboard.
+
+    The keys never change shape, so the unpressed keyboard is rendered once into a
+    pixmap at device resolution. Each paint draws that pixmap, then only the keys
+    that are currently pressed. The result is itself cached by Qt, so frames in which
+    no key changes are a single blit.
+    """
+    key_radius = 0.2
+    pressed_color = (150, 180, 220)
+    background_color = (0, 0, 0)  # fills the gaps between rounded key corners
+
     def __init__(self):
         super().__init__()
+        # repainted only when a key is pressed or released (see key_on / key_off)
+        self.setCacheMode(self.CacheMode.DeviceCoordinateCache)
         self.keys = self.key_spec()
+        black_keys = QtGui.QPainterPath()
+        bounds = QtCore.QRectF(0, 0, 88, 0)
         for key in self.keys:
             key['pressed'] = False
-            key['item'] = KeyItem(key)
-            key['item'].setParentItem(self)
+            key['rect'] = QtCore.QRectF(key['x_pos'], -0.1, key['width'], 10.1 * key['height'])
+            key['path'] = QtGui.QPainterPath()
+            key['path'].addRoundedRect(key['rect'], self.key_radius, self.key_radius)
+            key['brush'] = cached_brush(key['color'])
+            key['pressed_brush'] = cached_brush(Color(key['color']).mix(Color(self.pressed_color)).getRgb())
+            if key['is_black_key']:
+                black_keys.addPath(key['path'])
+            bounds = bounds.united(key['rect'])
+        self._key_bounds = bounds
+
+        # only the part of each white key not covered by black keys is redrawn when pressed
+        for key in self.keys:
+            if key['is_black_key']:
+                key['visible_path'] = key['path']
+            else:
+                key['visible_path'] = key['path'].subtracted(black_keys)
+
+        self._pen = cached_pen((0, 0, 0))
+        self._background = None
+        self._background_bounds = None
 
     @staticmethod
     def key_spec():
@@ -69,31 +104,60 @@ class Keyboard(QtWidgets.QGraphicsWidget):
     def key_on(self, key_id):
         key = self.keys[key_id]
         key['pressed'] = True
-        key['item'].update_press_state()
+        # Redraw the whole (cached) keyboard: repainting only part of the cache would resample
+        # the scaled background pixmap differently along the edge of the updated region.
+        self.update()
 
     def key_off(self, key_id):
         key = self.keys[key_id]
         key['pressed'] = False
-        key['item'].update_press_state()
-
-
-class KeyItem(RectItem):
-    def __init__(self, key):
-        super().__init__(
-            x=key['x_pos'], 
-            y=-0.1, 
-            w=key['width'], 
-            h=10.1 * key['height'],
-            brush=key['color'],
-            pen=(0, 0, 0),
-            radius=0.2,
-            z=10 if key['is_black_key'] else 0,
-        )
-        self.key = key
-
-    def update_press_state(self):
-        if self.key['pressed']:
-            color = Color(self.key['color']).mix(Color((150, 180, 220)))
-            self.setBrush(Brush(color))
-        else:
-            self.setBrush(Brush(self.key['color']))
+        self.update()
+
+    def boundingRect(self):
+        return super().boundingRect().united(self._key_bounds)
+
+    def paint(self, painter, option, widget=None):
+        bounds = self.boundingRect()
+        # size of the keyboard in device pixels
+        device_rect = painter.worldTransform().mapRect(bounds)
+        dpr = painter.device().devicePixelRatioF()
+        size = QtCore.QSize(math.ceil(device_rect.width() * dpr), math.ceil(device_rect.height() * dpr))
+        if size.isEmpty():
+            return
+        if self._background is None or self._background.size() != size or self._background_bounds != bounds:
+            self._background = self._render_keys(bounds, size)
+            self._background_bounds = bounds
+        painter.drawPixmap(bounds, self._background, QtCore.QRectF(self._background.rect()))
+
+        # draw pressed white keys first so that black keys stay on top
+        painter.setPen(self._pen)
+        for is_black in (False, True):
+            for key in self.keys:
+                if key['pressed'] and key['is_black_key'] == is_black:
+                    painter.setBrush(key['pressed_brush'])
+                    painter.drawPath(key['visible_path'])
+
+    def _render_keys(self, bounds, size):
+        """Return an opaque pixmap of the given size covering *bounds*, containing all keys
+        in their unpressed state"""
+        pixmap = QtGui.QPixmap(size)
+        pixmap.fill(Color(self.background_color))
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHints(QtGui.QPainter.Antialiasing)
+        painter.scale(size.width() / bounds.width(), size.height() / bounds.height())
+        painter.translate(-bounds.left(), -bounds.top())
+        painter.setPen(self._pen)
+        for is_black in (False, True):
+            for key in self.keys:
+                if key['is_black_key'] == is_black:
+                    painter.setBrush(key['brush'])
+                    painter.drawPath(key['path'])
+        painter.end()
+        return pixmap
+
+
+# key layout as flat arrays, computed once at import for vectorized lookups by key index
+_key_spec = Keyboard.key_spec()
+key_x = np.array([key['x_pos'] for key in _key_spec], dtype=np.float32)
+key_width = np.array([key['width'] for key in _key_spec], dtype=np.float32)
+del _key_spec
@@ -5,7 +5,7 @@ from .overview import Overview
 from .view import View
 from .ctrl_panel import CtrlPanel
 from .scroller import TimeScroller
-from .midi import load_midi
+from .midi import MidiLoader
 from .musicxml import load_musicxml
 from .file_tree import FileTree
 from .tracklist import TrackList
@@ -18,6 +18,8 @@ class MainWindow(QtWidgets.QWidget):
     def __init__(self):
         super().__init__()
         self.last_filename = None
+        self.loading_filename = None
+        self.midi_loader = None
 
         self.scroller = TimeScroller()
 
@@ -66,19 +68,39 @@ class MainWindow(QtWidgets.QWidget):
         self.overview.resizeEvent()
 
     def load(self, filename):
-        """Load a MIDI or MusicXML file and display it on the waterfall"""
+        """Load a MIDI or MusicXML file and display it on the waterfall
+
+        MIDI files are parsed in a background thread; the song is displayed when loading finishes.
+        """
         filename = os.path.expanduser(filename)
-        ext = os.path.splitext(filename)[1]
+        ext = os.path.splitext(filename)[1].lower()
         if filename == '':
-            return        
-        elif ext in ['.mid', '.midi']:
-            song = load_midi(filename)
+            return
+        self.loading_filename = filename
+        if ext in ['.mid', '.midi']:
+            # keep a reference to the loader until another file is loaded
+            self.midi_loader = MidiLoader(filename)
+            self.midi_loader.finished.connect(self._midi_loaded)
+            self.midi_loader.failed.connect(self._midi_load_failed)
+            self.midi_loader.start()
+            return
         elif ext in ['.xml', '.mxl', '.musicxml']:
             song = load_musicxml(filename, add_line_numbers=True)
         else:
             raise ValueError(f'Unsupported file type: {filename}')
         self.set_song(song, filename)
 
+    def _midi_loaded(self, song, filename):
+        if filename != self.loading_filename:
+            # another file was loaded in the meantime
+            return
+        self.set_song(song, filename)
+
+    def _midi_load_failed(self, exc, filename):
+        if filename != self.loading_filename:
+            return
+        raise exc
+
     def set_song(self, song, filename):
         self.song = song
         
@@ -1,5 +1,6 @@
 import time
 import mido
+import numpy as np
 from .qt import QtCore
 from .song import Pitch, Song, Note, Part
 
@@ -34,79 +35,128 @@ class MidiMessage:
         return f'<MidiMessage {self.perf_counter} {self.type} {self.note}>'
 
 
+# Columnar representation of MIDI messages used while loading a file
+_midi_event_dtype = np.dtype([
+    ('ticks', np.int64),    # absolute tick count
+    ('type', np.int8),      # one of the _MIDI_* type codes below
+    ('note', np.int16),
+    ('velocity', np.int16),
+    ('channel', np.int16),
+    ('tempo', np.int64),    # only meaningful for set_tempo messages
+    ('track', np.int32),
+    ('index', np.int32),    # index of message within the file
+])
+_MIDI_OTHER, _MIDI_NOTE_ON, _MIDI_NOTE_OFF, _MIDI_SET_TEMPO = range(4)
+
+
+def _midi_track_events(track, track_n, first_index=0):
+    """Return a structured array describing every message in a MIDI track"""
+    rows = []
+    for i, msg in enumerate(track, start=first_index):
+        if msg.type == 'note_on' or msg.type == 'note_off':
+            # note_on with velocity 0 is equivalent to note_off
+            is_on = msg.type == 'note_on' and msg.velocity > 0
+            ev_type = _MIDI_NOTE_ON if is_on else _MIDI_NOTE_OFF
+            rows.append((msg.time, ev_type, msg.note, msg.velocity, msg.channel, 0, track_n, i))
+        elif msg.type == 'set_tempo':
+            rows.append((msg.time, _MIDI_SET_TEMPO, 0, 0, 0, msg.tempo, track_n, i))
+        else:
+            rows.append((msg.time, _MIDI_OTHER, 0, 0, 0, 0, track_n, i))
+    events = np.array(rows, dtype=_midi_event_dtype)
+    events['ticks'] = np.cumsum(events['ticks'])
+    return events
+
+
+def _ticks_to_seconds(ticks, tempo_ticks, tempos, ticks_per_beat):
+    """Convert absolute tick counts to seconds, accounting for tempo changes.
+
+    *tempo_ticks* and *tempos* give the (sorted) tick and tempo (microseconds per beat)
+    of each tempo change.
+    """
+    # tempo segments always start at tick 0 with the default tempo
+    seg_ticks = np.concatenate([[0], tempo_ticks]).astype(np.int64)
+    seg_tempos = np.concatenate([[500000], tempos]).astype(np.float64)
+    sec_per_tick = seg_tempos * 1e-6 / ticks_per_beat
+    seg_seconds = np.concatenate([[0.0], np.cumsum(np.diff(seg_ticks) * sec_per_tick[:-1])])
+
+    seg = np.searchsorted(seg_ticks, ticks, side='right') - 1
+    return seg_seconds[seg] + (ticks - seg_ticks[seg]) * sec_per_tick[seg]
+
+
 def load_midi(filename:str) -> Song:
     """Load a MIDI file and display it on the waterfall"""
     midi = mido.MidiFile(filename)
     assert midi.type in (0, 1)
 
-    messages = []
     parts = []
+    messages = []
+    events = []
     for i, track in enumerate(midi.tracks):
         parts.append(MidiPart(track, i))
-        # create a dict for each message that contains the absolute tick count
-        # and the message itself
-        ticks = 0
-        prev_track_msg = None
-        for msg in track:
-            ticks += msg.time
-            messages.append({'ticks': ticks, 'midi': msg, 'part': parts[-1], 'prev_track_msg': prev_track_msg})
-            prev_track_msg = messages[-1]
-
-    # sort messages by tick
-    messages = sorted(messages, key=lambda m: m['ticks'])
+        events.append(_midi_track_events(track, i, first_index=len(messages)))
+        messages.extend(track)
+    events = np.concatenate(events)
+
+    # Merge tracks by tick. Each track is already sorted, and numpy's stable sort (timsort)
+    # detects these runs, so this is effectively a k-way merge rather than a full sort.
+    # Being stable, messages at the same tick keep their track order.
+    if len(midi.tracks) > 1:
+        events = events[np.argsort(events['ticks'], kind='stable')]
 
     # calculate absolute time of each message, accounting for tempo changes that affect all tracks
-    tempo = 500000
-    ticks_per_beat = midi.ticks_per_beat
-    abs_time = 0
-    last_ticks = 0
-
-    for msg in messages:
-        ticks = msg['ticks']
-        # Update absolute time based on the elapsed ticks and current tempo
-        dt = mido.tick2second(ticks - last_ticks, ticks_per_beat, tempo)
-        abs_time += dt
-        msg['time'] = abs_time
-
-        # If the message is a tempo change, update the tempo
-        if msg['midi'].type == 'set_tempo':
-            tempo = msg['midi'].tempo
-
-        last_ticks = ticks
-
-    # collapse note_on / note_off messages into a single event with duration
-    current_notes = {}  # To store the notes currently being played
-    notes = []  # Store the complete notes
-    for message in messages:
-        msg = message['midi']
-        msg_time = message['time']
-        if msg.type == 'note_on' and msg.velocity > 0:
-            note_key = (msg.note, msg.channel)
-            note = Note(
-                start_time=msg_time, 
-                pitch=Pitch(midi_note=msg.note), 
-                duration=None, 
-                part=message['part'],
-                on_msg=message, off_msg=None
-            )
-            notes.append(note)
-            if note_key in current_notes:
-                # end previous note here
-                prev_note = current_notes[note_key]
-                prev_note.duration = msg_time - prev_note.start_time
-            current_notes[note_key] = note
-        elif msg.type == 'note_off' or (msg.type == 'note_on' and msg.velocity == 0):
-            note_key = (msg.note, msg.channel)
-            if note_key not in current_notes:
-                continue
-            note_end = msg_time
-            note_start = current_notes[note_key].start_time
-            current_notes[note_key].duration = note_end - note_start
-            del current_notes[note_key]
+    tempo_events = events[events['type'] == _MIDI_SET_TEMPO]
+    note_events = events[(events['type'] == _MIDI_NOTE_ON) | (events['type'] == _MIDI_NOTE_OFF)]
+    times = _ticks_to_seconds(note_events['ticks'], tempo_events['ticks'], tempo_events['tempo'], midi.ticks_per_beat)
+
+    # collapse note_on / note_off messages into a single event with duration:
+    # a note_on ends at the next note_on or note_off for the same (channel, note), if any
+    note_keys = note_events['channel'].astype(np.int32) * 128 + note_events['note']
+    by_key = np.argsort(note_keys, kind='stable')
+    next_time = np.full(len(times), np.nan)
+    same_key = note_keys[by_key[1:]] == note_keys[by_key[:-1]]
+    next_time[by_key[:-1][same_key]] = times[by_key[1:][same_key]]
+
+    note_on = note_events['type'] == _MIDI_NOTE_ON
+    notes = []
+    for start, end, note, track_n, index in zip(
+            times[note_on].tolist(), next_time[note_on].tolist(), note_events['note'][note_on].tolist(),
+            note_events['track'][note_on].tolist(), note_events['index'][note_on].tolist()):
+        notes.append(Note(
+            start_time=start,
+            pitch=Pitch.from_midi_note(note),
+            duration=None if end != end else end - start,  # NaN: note never ended
+            part=parts[track_n],
+            on_msg=messages[index], off_msg=None
+        ))
 
     return Song(notes)
 
 
+class MidiLoader(QtCore.QObject):
+    """Loads a MIDI file on a QThreadPool worker thread.
+
+    Emits *finished(song, filename)* when loading completes, or *failed(exc, filename)*
+    if an exception was raised. Both are delivered to receivers in the GUI thread.
+    """
+    finished = QtCore.Signal(object, object)
+    failed = QtCore.Signal(object, object)
+
+    def __init__(self, filename):
+        super().__init__()
+        self.filename = filename
+
+    def start(self):
+        QtCore.QThreadPool.globalInstance().start(self.run)
+
+    def run(self):
+        try:
+            song = load_midi(self.filename)
+        except Exception as exc:
+            self.failed.emit(exc, self.filename)
+            return
+        self.finished.emit(song, self.filename)
+
+
 class MidiPart(Part):
     def __init__(self, midi_track, track_n):
         track_name = midi_track.name
@@ -447,7 +447,7 @@ class MusicXMLParser:
         # Calculate MIDI note number
         midi_note = (octave + 1) * 12 + semitone
 
-        return Pitch(midi_note=midi_note)
+        return Pitch.from_midi_note(midi_note)
 
     def parse_note_element(self, note_elem):
         # Check if it's a rest
@@ -1,79 +1,168 @@
 import numpy as np
-from .qt import QtCore, QtGui, QtWidgets, Color, Pen, GraphicsItemGroup
-from .keyboard import Keyboard
+from .qt import QtCore, QtGui, QtWidgets, Color, Brush, cached_pen, cached_brush
+from .keyboard import key_x, key_width
+
+
+class NotesItem(QtWidgets.QGraphicsItem):
+    """Graphics item that draws all notes in a song.
+
+    Rather than creating one graphics item per note, note geometry is stored in a
+    structured array and all notes belonging to a track are drawn with a single drawRects() call.
+    Only notes that intersect the exposed area are drawn.
+    """
+    highlight_length = 0.05  # seconds of white highlight at the start of each note
+    note_dtype = np.dtype([
+        ('t0', 'f4'),     # start time
+        ('dur', 'f4'),    # duration
+        ('key', 'i2'),    # keyboard key index
+        ('track', 'i2'),  # index into self.tracks
+        ('x', 'f4'),      # key position and width
+        ('w', 'f4'),
+    ])
 
-
-class NotesItem(GraphicsItemGroup):
     def __init__(self):
         super().__init__()
+        # needed to receive option.exposedRect in paint()
+        self.setFlag(self.GraphicsItemFlag.ItemUsesExtendedStyleOption, True)
+        # notes only need to be repainted when they change or are scaled;
+        # scrolling just moves the cached pixmap
+        self.setCacheMode(self.CacheMode.DeviceCoordinateCache)
         self._bounds = QtCore.QRectF()
-        self.notes = []
+        self._notes_np = np.empty(0, dtype=self.note_dtype)
 
         self.track_colors = {}
+        self.tracks = []  # unique track keys; the 'track' field of each note indexes this list
+
+        self._border_brush = cached_brush((0, 0, 0, 208))
+        self._highlight_brush = self._make_gradient_brush(Color((255, 255, 255, 255)), Color((255, 255, 255, 0)))
+        self._brushes = []
+        self._rects = []
+        self._track_notes = []
+        self._rect_ends = []
+        self._highlight_rects = []
 
-        self.key_spec = Keyboard.key_spec()
-        self.bars = [QtWidgets.QGraphicsLineItem(self.key_spec[0]['x_pos'], 0, self.key_spec[-1]['x_pos'] + self.key_spec[-1]['width'], 0)]
+        self.bars = [QtWidgets.QGraphicsLineItem(float(key_x[0]), 0, float(key_x[-1] + key_width[-1]), 0)]
         for item in self.bars:
-            item.setPen(Pen((100, 100, 100)))
-            self.addToGroup(item)
+            item.setPen(cached_pen((100, 100, 100)))
+            item.setParentItem(self)
+
+        self.set_notes([])
 
     def set_track_colors(self, track_colors):
         self.track_colors = track_colors
-        for note_item in self.notes:
-            note_item.set_color(self.get_color(note_item.track_key))
+        self._brushes = [self.make_brush(self.get_color(track_key)) for track_key in self.tracks]
+        self.update()
 
     def get_color(self, track_key):
         return self.track_colors.get(track_key, (100, 100, 100))
 
     def set_notes(self, notes):
-        bounds = QtCore.QRectF()
-
-        # Clear any existing notes
-        for note_item in self.notes:
-            self.scene().removeItem(note_item)
-        self.notes.clear()
-
-        # Create new notes
-        for i, note in enumerate(notes):
-            if note.duration == 0:
-                continue
-            if note.pitch.key < 0 or note.pitch.key >= len(self.key_spec):
-                continue
-            keyspec = self.key_spec[note.pitch.key]
-            track_key = (note.part, note.staff)
-            color = self.get_color(track_key)
-
-            note_item = NoteItem(x=keyspec['x_pos'], y=note.start_time, w=keyspec['width'], h=note.duration, 
-                                 color=color, z=i, note=note)
-            self.notes.append(note_item)
-            self.addToGroup(note_item)
-            bounds = bounds.united(note_item.boundingRect())
-
-        self._bounds = bounds
+        notes = [
+            note for note in notes
+            if note.duration and 0 <= note.pitch.key < len(key_x)
+        ]
+
+        # assign track indices in order of first appearance
+        track_index = {}
+        note_tracks = [track_index.setdefault((note.part, note.staff), len(track_index)) for note in notes]
+        self.tracks = list(track_index)
+
+        # one record per note; field arrays are contiguous so culling can be done with searchsorted
+        n = len(notes)
+        arr = np.empty(n, dtype=self.note_dtype)
+        arr['t0'] = np.fromiter((note.start_time for note in notes), dtype=np.float32, count=n)
+        arr['dur'] = np.fromiter((note.duration for note in notes), dtype=np.float32, count=n)
+        arr['key'] = np.fromiter((note.pitch.key for note in notes), dtype=np.int16, count=n)
+        arr['track'] = note_tracks
+        arr['x'] = key_x[arr['key']]
+        arr['w'] = key_width[arr['key']]
+        self._notes_np = arr
+
+        # precompute rects grouped by track so that each track is drawn in one call
+        self._rects = [[] for _ in self.tracks]
+        for x, y, w, h, t in zip(arr['x'].tolist(), arr['t0'].tolist(), arr['w'].tolist(), arr['dur'].tolist(), arr['track'].tolist()):
+            self._rects[t].append(QtCore.QRectF(x, y, w, h))
+
+        # Notes are sorted by start time, so the visible range of each track can be found
+        # by bisection. End times are not sorted, so we use their running maximum instead:
+        # every note before the first index where this reaches the exposed region ends before it.
+        self._track_notes = []
+        self._rect_ends = []
+        for t in range(len(self.tracks)):
+            track_notes = arr[arr['track'] == t]
+            self._track_notes.append(track_notes)
+            self._rect_ends.append(np.maximum.accumulate(track_notes['t0'] + track_notes['dur']))
+        self._highlight_rects = [
+            QtCore.QRectF(x, y, w, h)
+            for x, y, w, h in zip(arr['x'].tolist(), arr['t0'].tolist(), arr['w'].tolist(), np.minimum(arr['dur'], self.highlight_length).tolist())
+        ]
+
+        self.prepareGeometryChange()
+        if n == 0:
+            self._bounds = QtCore.QRectF()
+        else:
+            x0, y0 = arr['x'].min(), arr['t0'].min()
+            x1, y1 = (arr['x'] + arr['w']).max(), (arr['t0'] + arr['dur']).max()
+            self._bounds = QtCore.QRectF(float(x0), float(y0), float(x1 - x0), float(y1 - y0))
+
+        self.set_track_colors(self.track_colors)
+
+    def make_brush(self, color):
+        """Return the gradient brush used to fill notes of the given color"""
+        color = Color(color)
+        return self._make_gradient_brush(color, color * 0.5)
+
+    @staticmethod
+    def _make_gradient_brush(start_color, stop_color):
+        # gradient runs along each rect drawn, from the note start to its end
+        grad = QtGui.QLinearGradient(QtCore.QPointF(0, 0), QtCore.QPointF(0, 1))
+        grad.setCoordinateMode(QtGui.QGradient.CoordinateMode.ObjectMode)
+        grad.setColorAt(0, start_color)
+        grad.setColorAt(1, stop_color)
+        return Brush(grad)
 
     def boundingRect(self):
         return self._bounds
 
-
-class NoteItem(QtWidgets.QGraphicsRectItem):
-    def __init__(self, x, y, w, h, color, z, note):
-        self.note = note
-        self.track_key = (note.part, note.staff)
-
-        self.grad = QtGui.QLinearGradient(QtCore.QPointF(0, 0), QtCore.QPointF(0, 1))
-        self.grad.setCoordinateMode(QtGui.QGradient.CoordinateMode.ObjectMode)
-        color = 0.5 * Color(color)
-        self.grad.setColorAt(0, Color((255, 255, 255)))
-        self.grad.setColorAt(np.clip(.05/h, 0, 1), color)
-        self.grad.setColorAt(1, color * 0.5)
-
-        QtWidgets.QGraphicsRectItem.__init__(self, x, y, w, h)
-        self.setBrush(self.grad)
-        self.setPen(Pen((0, 0, 0, 208)))
-        self.setZValue(z)
-
-    def set_color(self, color):
-        self.grad.setColorAt(np.clip(.05/self.rect().height(), 0, 1), Color(color))
-        self.grad.setColorAt(1, Color(color) * 0.5)
-        self.setBrush(self.grad)
-        self.update()
+    def paint(self, painter, option, widget=None):
+        exposed = option.exposedRect
+        y0, y1 = exposed.top(), exposed.bottom()
+
+        # Notes are filled without a pen. Each track's rects are first filled with a dark
+        # brush, then filled again inset by half a device pixel, leaving a dark border
+        # (the inner half of what a 1px outline would cover).
+        # Notes no taller than one device pixel would not show a border or highlight, so
+        # they are filled once with the track brush and skipped by the other passes.
+        transform = painter.worldTransform()
+        dx = 0.5 / abs(transform.m11())
+        dy = 0.5 / abs(transform.m22())
+        painter.setPen(cached_pen(None))
+        for rects, notes, ends, brush in zip(self._rects, self._track_notes, self._rect_ends, self._brushes):
+            lo = np.searchsorted(ends, y0)
+            hi = np.searchsorted(notes['t0'], y1, side='right')
+            if hi <= lo:
+                continue
+            visible = notes[lo:hi]
+            large = (visible['dur'] > 2 * dy).tolist()
+            visible_rects = rects[lo:hi]
+            large_rects = [rect for rect, is_large in zip(visible_rects, large) if is_large]
+
+            painter.setBrush(self._border_brush)
+            painter.drawRects(large_rects)
+
+            painter.setBrush(brush)
+            painter.drawRects([rect for rect, is_large in zip(visible_rects, large) if not is_large])
+            painter.drawRects([
+                QtCore.QRectF(x + dx, y + dy, w - 2 * dx, h - 2 * dy)
+                for x, y, w, h, is_large in zip(visible['x'].tolist(), visible['t0'].tolist(), visible['w'].tolist(), visible['dur'].tolist(), large)
+                if is_large
+            ])
+
+        # white highlight at the start of each note
+        starts = self._notes_np['t0']
+        lo = np.searchsorted(starts, y0 - self.highlight_length)
+        hi = np.searchsorted(starts, y1, side='right')
+        if hi > lo:
+            large = (self._notes_np['dur'][lo:hi] > 2 * dy).tolist()
+            painter.setBrush(self._highlight_brush)
+            painter.drawRects([rect for rect, is_large in zip(self._highlight_rects[lo:hi], large) if is_large])
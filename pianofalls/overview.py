@@ -21,6 +21,9 @@ class Overview(QtWidgets.QGraphicsView):
         self.setRenderHints(QtGui.QPainter.Antialiasing)
 
         self._scene = QtWidgets.QGraphicsScene(parent=self)
+        # the scene holds only a handful of items (all notes are drawn by one NotesItem),
+        # so a BSP index would cost more to maintain than it saves
+        self._scene.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self._scene)
 
         self.group = QtWidgets.QGraphicsItemGroup()
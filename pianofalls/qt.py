@@ -1,6 +1,12 @@
-import math, sys
+import sys
 from qtpy import QtWidgets, QtGui, QtCore
 
+try:
+    from qtpy.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:
+    # Qt5 keeps QOpenGLWidget in QtWidgets
+    QOpenGLWidget = QtWidgets.QOpenGLWidget
+
 
 # Needed to prevent abort when exceptions are raised in Qt slots
 def excepthook(type, value, traceback):
@@ -27,6 +33,31 @@ class Brush(QtGui.QBrush):
         super().__init__(arg)        
 
 
+# Pens and brushes are shared between all users of the same color, since only a
+# handful of distinct colors are used. QPen/QBrush are copied when set on an item or
+# painter, but the cached objects themselves must not be modified.
+_pen_cache = {}
+_brush_cache = {}
+
+
+def cached_pen(arg):
+    """Return a shared Pen for *arg* (an RGB(A) tuple or None)."""
+    pen = _pen_cache.get(arg)
+    if pen is None:
+        pen = Pen(arg)
+        _pen_cache[arg] = pen
+    return pen
+
+
+def cached_brush(arg):
+    """Return a shared Brush for *arg* (an RGB(A) tuple or None)."""
+    brush = _brush_cache.get(arg)
+    if brush is None:
+        brush = Brush(arg)
+        _brush_cache[arg] = brush
+    return brush
+
+
 class Color(QtGui.QColor):
     def __init__(self, arg):
         if not isinstance(arg, QtGui.QColor):
@@ -53,46 +84,27 @@ class Color(QtGui.QColor):
         ))
 
 
-class GraphicsItemGroup(QtWidgets.QGraphicsItem):
+class AnimationClock(QtCore.QAbstractAnimation):
+    """Emits *tick* once per frame of Qt's animation timer, until stopped.
+
+    All running animations are driven by a single shared timer, so this stays in step
+    with other animations and repaints rather than drifting on its own QTimer.
+    """
+    tick = QtCore.Signal()
+
+    def duration(self):
+        return -1  # run forever
+
+    def updateCurrentTime(self, current_time):
+        self.tick.emit()
+
+
+class GraphicsItemGroup(QtWidgets.QGraphicsItemGroup):
+    """Group of graphics items that are transformed together.
+
+    Qt's own item group keeps track of its children and bounding rect in C++.
+    """
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.items = []
-
-    def addToGroup(self, item):
-        self.items.append(item)
-        item.setParentItem(self)
-
-    def removeFromGroup(self, item):
-        self.items.remove(item)
-        item.setParentItem(None)
-
-    def boundingRect(self):
-        return self.childrenBoundingRect()
-
-    def paint(self, painter, option, widget):
-        pass
-
-
-class RectItem(QtWidgets.QGraphicsPolygonItem):
-    def __init__(self, x, y, w, h, pen, brush, radius=0.1, radius_steps=4, z=0):
-        corners = [
-            [x+radius, y+radius], 
-            [x+w-radius, y+radius], 
-            [x+w-radius, y+h-radius], 
-            [x+radius, y+h-radius]
-        ]
-        points = []
-        for i, corner in enumerate(corners):
-            start_angle = math.pi * (i / 2 - 1)
-            stop_angle = math.pi * (i / 2 - 0.5)
-            d_angle = (stop_angle - start_angle) / (radius_steps - 1)
-            for j in range(radius_steps):
-                angle = start_angle + j * d_angle
-                x = corner[0] + radius * math.cos(angle)
-                y = corner[1] + radius * math.sin(angle)
-                points.append(QtCore.QPointF(x, y))
-        self.poly = QtGui.QPolygonF(points)
-        super().__init__(self.poly)
-        self.setPen(Pen(pen))
-        self.setBrush(Brush(brush))
-        self.setZValue(z)
+        # the group itself draws nothing; skip it when painting
+        self.setFlag(self.GraphicsItemFlag.ItemHasNoContents, True)
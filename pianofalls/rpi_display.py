@@ -4,7 +4,7 @@ import numpy as np
 import pyqtgraph as pg
 from .qt import QtGui, QtCore
 from .config import config
-from .keyboard import Keyboard
+from .keyboard import key_x, key_width
 from .song import Note, Barline
 
 
@@ -64,6 +64,8 @@ class FrameSender:
 
         self.next_frame = None
         self.stop = False
+        # set whenever there is a new frame to send (or when closing)
+        self._wake = threading.Event()
 
         self.thread = threading.Thread(target=self.run, daemon=True)
         self.thread.start()
@@ -79,13 +81,17 @@ class FrameSender:
             sock.connect((self.host, self.port))
 
         last_frame = None
-        while not self.stop:
+        while True:
+            # sleep until a frame arrives rather than polling for one
+            self._wake.wait()
+            self._wake.clear()
+            if self.stop:
+                break
             frame = self.next_frame
+            # a frame set between clear() and here also leaves the event set; don't send it twice
             if frame is last_frame:
-                time.sleep(0.003)
                 continue
             last_frame = frame
-
             self._send_frame(sock, frame)
 
         # send a blank frame before closing socket
@@ -97,20 +103,23 @@ class FrameSender:
 
     def send_frame(self, frame):
         self.next_frame = frame
+        self._wake.set()
 
     def close(self):
         self.stop = True
+        self._wake.set()
 
     def _send_frame(self, sock, frame):
+        # send straight from the array's memory; slicing a memoryview does not copy
+        data = memoryview(np.ascontiguousarray(frame)).cast('B')
         if self.udp:
-            frame = frame.tobytes()
             sent = 0
             max_size = 65507
-            while sent < len(frame):
-                sock.sendto(frame[sent:sent+max_size], (self.host, self.port))
+            while sent < len(data):
+                sock.sendto(data[sent:sent+max_size], (self.host, self.port))
                 sent += max_size
         else:
-            sock.sendall(frame)
+            sock.sendall(data)
 
 
 
@@ -149,7 +158,6 @@ class RPiRenderer:
         rows, cols = config['rpi_display']['resolution']
         first_col, last_col = config['rpi_display']['bounds']
         used_cols = last_col - first_col
-        all_keyspec = Keyboard.key_spec()
         frame = np.zeros((rows, cols, 3), dtype='uint8')
         
         events = self.song.get_events_active_in_range(time_range)
@@ -166,6 +174,8 @@ class RPiRenderer:
                 start_y_pixel = y_pixel_offset + frame.shape[0] - (row_scale * event.start_time)
                 draw_interpolated_line(frame, start_y_pixel-1, 0, frame.shape[1], np.array([4, 4, 4]))
 
+        # (dark, bright) gradient colors for each track, built once per track rather than per note
+        color_table = {}
         for event in events:        
             if not isinstance(event, Note):
                 continue
@@ -173,18 +183,21 @@ class RPiRenderer:
             if note.duration == 0:
                 continue
             try:
-                keyspec = all_keyspec[note.pitch.key]
+                x_pos, width = float(key_x[note.pitch.key]), float(key_width[note.pitch.key])
             except IndexError:
                 continue
-            color = track_colors.get(note.track, (100, 100, 100))
+            colors = color_table.get(note.track_key)
+            if colors is None:
+                color = np.array(track_colors.get(note.track_key, (100, 100, 100)))
+                colors = color_table[note.track_key] = (color * 0.25, color)
             start_y_pixel = y_pixel_offset + frame.shape[0] - (row_scale * note.start_time)
             stop_y_pixel = start_y_pixel - (row_scale * note.duration)
 
-            w = int(keyspec['width'] * col_scale)
-            x1 = first_col + int(keyspec['x_pos'] * col_scale)
+            w = int(width * col_scale)
+            x1 = first_col + int(x_pos * col_scale)
             x2 = x1 + w
             # print(note, start_y_pixel, stop_y_pixel)
-            draw_interpolated_box(frame, stop_y_pixel, start_y_pixel, x1, x2, (np.array(color)*0.25, np.array(color)))
+            draw_interpolated_box(frame, stop_y_pixel, start_y_pixel, x1, x2, colors)
             if not event.played:
                 draw_interpolated_line(frame, start_y_pixel-1, x1, x2, np.array([255, 255, 255]))
 
@@ -215,18 +228,29 @@ class GraphicsViewUpdateWatcher(QtCore.QObject):
     def __init__(self, view):
         super().__init__()
         self.resolution = config['rpi_display']['resolution']
+        rows, cols = self.resolution
+        # render target reused for every frame
+        self._image = QtGui.QImage(cols, rows, QtGui.QImage.Format_RGB888)
         self.view = view
         self.timer = QtCore.QTimer()
+        # True while a frame is scheduled but has not been rendered yet
+        self._dirty = False
         # use qt event filter to detect when view is repainted
         view.viewport().installEventFilter(self)
 
     def eventFilter(self, obj, event):
         try:
-            if obj == self.view.viewport() and event.type() == QtCore.QEvent.Paint:
-                self.timer.singleShot(0, self.emit_frame)
+            if obj == self.view.viewport() and event.type() == QtCore.QEvent.Paint and not self._dirty:
+                # coalesce all paint events up to the next event loop iteration into one frame
+                self._dirty = True
+                self.timer.singleShot(0, self._flush)
         except RuntimeError:
             pass  # exit error
         return False
+
+    def _flush(self):
+        self._dirty = False
+        self.emit_frame()
     
     def emit_frame(self):
         img = self.render_frame_from_scene()
@@ -244,14 +268,18 @@ class GraphicsViewUpdateWatcher(QtCore.QObject):
         source_rect.setLeft(-2)
         source_rect.setRight(source_rect.right() + 2)
         source_rect.setTop(source_rect.bottom() - source_rect.width() * rows / cols)
-        return render_scene_to_rgb_bytes(self.view.scene, source_rect, cols, rows)
+        return render_scene_to_rgb_bytes(self.view.scene, source_rect, cols, rows, image=self._image)
 
 
-def render_scene_to_rgb_bytes(scene, source_rect, width, height):
-    # Create a QImage with the specified size and format
-    image = QtGui.QImage(width, height, QtGui.QImage.Format_RGB888)
-    
-    # Fill the image with white (optional)
+def render_scene_to_rgb_bytes(scene, source_rect, width, height, image=None):
+    """Render a region of *scene* and return it as a (height, width, 3) uint8 array.
+
+    If *image* is given, it must be a width x height QImage in Format_RGB888; it is reused
+    as the render target instead of allocating a new one. The returned array is always
+    a new copy, since the previous frame may still be in use by the receiver.
+    """
+    if image is None:
+        image = QtGui.QImage(width, height, QtGui.QImage.Format_RGB888)
     image.fill(QtCore.Qt.black)
     
     # Create a QPainter to paint on the QImage
@@ -264,12 +292,11 @@ def render_scene_to_rgb_bytes(scene, source_rect, width, height):
     # End the painting
     painter.end()
     
-    # Extract the 8-bit RGB values
-    ptr = image.bits()
-    ptr.setsize(image.sizeInBytes())
-    
-    arr = np.array(ptr).reshape((height, image.bytesPerLine()))[:, :width * 3].reshape((height, width, 3))
-    return np.ascontiguousarray(arr)
+    # Extract the 8-bit RGB values; rows may be padded to bytesPerLine
+    ptr = image.constBits()
+    ptr.setsize(height * image.bytesPerLine())
+    arr = np.frombuffer(ptr, dtype=np.uint8).reshape((height, image.bytesPerLine()))[:, :width * 3]
+    return arr.reshape((height, width, 3)).copy()
 
 
 def ndarray_from_qimage(qimg):
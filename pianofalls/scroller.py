@@ -1,7 +1,6 @@
 import queue
-import threading, math, time
-from .qt import QtCore
-import atexit
+import math, time
+from .qt import QtCore, AnimationClock
 
 
 class TimeScroller(QtCore.QObject):
@@ -21,10 +20,11 @@ class TimeScroller(QtCore.QObject):
 
         self.set_scroll_mode('wait')
 
-        self.stop_thread = False
-        self.thread = threading.Thread(target=self.auto_scroll_loop, daemon=True)
-        self.thread.start()
-        atexit.register(self.stop)
+        # advance the time once per animation frame, in step with repaints
+        self.last_update_time = time.perf_counter()
+        self.clock = AnimationClock(self)
+        self.clock.tick.connect(self.auto_scroll_step)
+        self.clock.start()
 
     def set_scrolling(self, scrolling):
         self.scrolling = scrolling
@@ -66,36 +66,30 @@ class TimeScroller(QtCore.QObject):
     def on_midi_message(self, midi_input, msg):
         self.scroll_mode.on_midi_message(msg)
 
-    def auto_scroll_loop(self):
-        last_time = time.perf_counter()
-        while not self.stop_thread:
-            now = time.perf_counter()
-            dt = now - last_time
-            last_time = now
-
-            if self.song is None:
-                time.sleep(0.1)
-                continue
-            
-            if self.scrolling:
-                self.target_time = self.scroll_mode.update(self.current_time, dt, self.scroll_speed)
-
-            # Exponentially approach target
-            if self.scroll_tau > 0:
-                self.current_time += (self.target_time - self.current_time) * math.exp(-dt / self.scroll_tau)
-            else:
-                self.current_time = self.target_time
-            self.current_time_changed.emit(self.current_time)
+    def auto_scroll_step(self):
+        now = time.perf_counter()
+        dt = now - self.last_update_time
+        self.last_update_time = now
+
+        if self.song is None:
+            return
 
-            last_note = self.song.notes[-1]
-            if self.current_time > last_note.start_time + last_note.duration:
-                self.set_scrolling(False)
+        if self.scrolling:
+            self.target_time = self.scroll_mode.update(self.current_time, dt, self.scroll_speed)
+
+        # Exponentially approach target
+        if self.scroll_tau > 0:
+            self.current_time += (self.target_time - self.current_time) * math.exp(-dt / self.scroll_tau)
+        else:
+            self.current_time = self.target_time
+        self.current_time_changed.emit(self.current_time)
 
-            time.sleep(0.003)
+        last_note = self.song.notes[-1]
+        if self.current_time > last_note.start_time + last_note.duration:
+            self.set_scrolling(False)
 
     def stop(self):
-        self.stop_thread = True
-        self.thread.join()
+        self.clock.stop()
 
 
 class ScrollMode:
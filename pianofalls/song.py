@@ -22,6 +22,9 @@ class Song:
             src_event.index = i
             self.events.append(src_event)
             if isinstance(src_event, Note) and src_event.pitch is not None:
+                # parts are assigned while parsing, so the track is only fixed from here on;
+                # store it to avoid rebuilding the tuple every time notes are drawn
+                src_event.track_key = src_event.track
                 self.notes.append(src_event)
 
         self.notes.sort(key=lambda n: (n.start_time, n.pitch.midi_note))
@@ -175,6 +178,21 @@ class Rest(VoiceEvent):
 
 
 class Pitch:
+    __slots__ = ('midi_note', 'key', 'note_name', 'octave')
+    _instances = {}
+
+    @classmethod
+    def from_midi_note(cls, midi_note):
+        """Return a shared Pitch for the given MIDI note number.
+
+        Pitches are never modified, so notes of the same pitch can share one instance
+        rather than allocating a new one per note.
+        """
+        pitch = cls._instances.get(midi_note)
+        if pitch is None:
+            pitch = cls._instances[midi_note] = cls(midi_note)
+        return pitch
+
     def __init__(self, midi_note):
         self.midi_note = midi_note
         self.key = midi_note - 21
@@ -1,5 +1,5 @@
 import time
-from .qt import QtWidgets, QtGui, QtCore
+from .qt import QtWidgets, QtGui, QtCore, QOpenGLWidget
 from .keyboard import Keyboard
 from .waterfall import Waterfall
 from .midi import Song
@@ -14,7 +14,12 @@ class View(QtWidgets.QGraphicsView):
         self.last_draw_time = time.perf_counter()
         self.average_draw_time = 0
 
+        self.use_opengl = self._setup_opengl_viewport()
+
         self.scene = QtWidgets.QGraphicsScene(parent=self)
+        # the waterfall moves every frame as the song scrolls; a BSP index would just be
+        # rebuilt constantly
+        self.scene.setItemIndexMethod(QtWidgets.QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self.scene)
 
         self.setBackgroundRole(QtGui.QPalette.ColorRole.NoRole)
@@ -25,13 +30,25 @@ class View(QtWidgets.QGraphicsView):
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setTransformationAnchor(QtWidgets.QGraphicsView.ViewportAnchor.NoAnchor)
         self.setResizeAnchor(QtWidgets.QGraphicsView.ViewportAnchor.AnchorViewCenter)
-        self.setViewportUpdateMode(QtWidgets.QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
-        self.setRenderHints(QtGui.QPainter.Antialiasing)
+        # The notes scroll every frame, so nearly the whole viewport is dirty anyway and
+        # tracking dirty regions per item costs more than it saves. (The GL framebuffer is
+        # also not preserved between frames.)
+        self.setViewportUpdateMode(QtWidgets.QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        # all items set their own pen and brush, and no update regions need padding
+        self.setOptimizationFlag(QtWidgets.QGraphicsView.OptimizationFlag.DontSavePainterState, True)
+        self.setOptimizationFlag(QtWidgets.QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+        if self.use_opengl:
+            # edges are smoothed by multisampling rather than by QPainter
+            self.setRenderHint(QtGui.QPainter.Antialiasing, False)
+        else:
+            self.setRenderHints(QtGui.QPainter.Antialiasing)
 
         self.keys = []
         self.items = []
 
         self.keyboard = Keyboard()
+        # keyboard is drawn over the bottom of the waterfall, hiding notes that have been played
+        self.keyboard.setZValue(1)
         self.scene.addItem(self.keyboard)
 
         self.waterfall = Waterfall()
@@ -39,6 +56,23 @@ class View(QtWidgets.QGraphicsView):
 
         self.resizeEvent()
 
+    def _setup_opengl_viewport(self):
+        """Render the scene with OpenGL if a context can be created.
+
+        Returns True if an OpenGL viewport was installed.
+        """
+        fmt = QtGui.QSurfaceFormat()
+        fmt.setSamples(4)
+        context = QtGui.QOpenGLContext()
+        context.setFormat(fmt)
+        if not context.create():
+            # no usable OpenGL; keep the default raster viewport
+            return False
+        viewport = QOpenGLWidget()
+        viewport.setFormat(fmt)
+        self.setViewport(viewport)
+        return True
+
     def set_track_colors(self, track_colors):
         self.waterfall.set_track_colors(track_colors)
 
@@ -49,7 +83,10 @@ class View(QtWidgets.QGraphicsView):
 
         key_height = 88 * 0.114
         waterfall_height = h - key_height
-        self.keyboard.setGeometry(0, waterfall_height, 88, key_height)
+        # extend the keyboard down to the bottom of the viewport (fitInView leaves a margin)
+        # so that it covers any notes below the waterfall
+        visible = self.mapToScene(self.viewport().rect()).boundingRect()
+        self.keyboard.setGeometry(0, waterfall_height, 88, max(key_height, visible.bottom() - waterfall_height))
         self.waterfall.setGeometry(0, 0, 88, waterfall_height)
 
     def wheelEvent(self, event):
@@ -1,4 +1,4 @@
-from .qt import QtCore, QtGui, QtWidgets, GraphicsItemGroup
+from .qt import QtCore, QtGui, QtWidgets, GraphicsItemGroup, AnimationClock
 from .song import Song
 from .notes_item import NotesItem
 
@@ -6,7 +6,8 @@ from .notes_item import NotesItem
 class Waterfall(QtWidgets.QGraphicsWidget):
     def __init__(self):
         super().__init__()
-        self.setFlag(self.GraphicsItemFlag.ItemClipsChildrenToShape)
+        # Notes are not clipped to the waterfall; the view clips to its viewport, and notes
+        # that scroll past the bottom are hidden behind the keyboard (see View.__init__).
 
         self.group = GraphicsItemGroup(self)
 
@@ -18,10 +19,17 @@ class Waterfall(QtWidgets.QGraphicsWidget):
         self.requested_time = 0.0
         self.zoom_factor = 1.0
 
-        # limit the update rate to 60 fps
-        self.update_timer = QtCore.QTimer()
-        self.update_timer.timeout.connect(self._update_time)
-        self.update_timer.start(16)
+        # apply the requested time at most once per animation frame
+        self.update_clock = AnimationClock(self)
+        self.update_clock.tick.connect(self._update_time)
+        self.update_clock.start()
+
+        # disable note caching while the zoom is changing, since every zoom step
+        # would invalidate the cache
+        self.zoom_cache_timer = QtCore.QTimer(self)
+        self.zoom_cache_timer.setSingleShot(True)
+        self.zoom_cache_timer.setInterval(300)
+        self.zoom_cache_timer.timeout.connect(self._restore_notes_cache)
 
         self.update_transform()
 
@@ -39,7 +47,7 @@ class Waterfall(QtWidgets.QGraphicsWidget):
         req_time = self.requested_time
         if req_time != self.current_time:    
             self.current_time = req_time
-            self.update_transform()
+            self.update_scroll()
 
     def zoom(self, factor: float):
         """Multiply the zoom by the given factor"""
@@ -47,16 +55,31 @@ class Waterfall(QtWidgets.QGraphicsWidget):
 
     def set_zoom(self, factor: float):
         self.zoom_factor = factor
+        self.notes_item.setCacheMode(self.notes_item.CacheMode.NoCache)
+        self.zoom_cache_timer.start()
         self.update_transform()
 
+    def _restore_notes_cache(self):
+        self.notes_item.setCacheMode(self.notes_item.CacheMode.DeviceCoordinateCache)
+
+    @property
+    def pixels_per_second(self):
+        return 6 * self.zoom_factor
+
     def update_transform(self):
+        """Update the scale of the notes; only needed when the zoom changes.
+        """
         transform = QtGui.QTransform()
-        transform.translate(0, self.geometry().height())
-        transform.scale(1, -6 * self.zoom_factor)
-        transform.translate(0, -self.current_time)
+        transform.scale(1, -self.pixels_per_second)
         self.group.setTransform(transform)
+        self.update_scroll()
 
-    def resizeEvent(self, event):
-        self.set_time(self.current_time)
+    def update_scroll(self):
+        """Scroll the notes to the current time.
 
+        This only moves the notes group, leaving its transform untouched.
+        """
+        self.group.setPos(0, self.geometry().height() + self.pixels_per_second * self.current_time)
 
+    def resizeEvent(self, event):
+        self.update_scroll()
@@ -0,0 +1,107 @@
+import os, sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import hashlib
+import tempfile
+import copy
+from pianofalls.config import Config, default_config
+
+
+def test_get_sha():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_file = os.path.join(tmpdir, 'config.json')
+        filename = os.path.join(tmpdir, 'song.mid')
+        with open(filename, 'wb') as f:
+            f.write(b'abc')
+
+        config = Config(config_file)
+        assert config.get_sha(filename) == hashlib.sha1(b'abc').hexdigest()
+
+        # cached digests are saved with the config
+        config.save()
+        config = Config(config_file)
+        assert config._sha_cache[os.path.abspath(filename)][2] == hashlib.sha1(b'abc').hexdigest()
+
+        # changing the file invalidates the cached digest
+        with open(filename, 'wb') as f:
+            f.write(b'abcd')
+        assert config.get_sha(filename) == hashlib.sha1(b'abcd').hexdigest()
+
+
+def test_sha_cache_pruned():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = Config(os.path.join(tmpdir, 'config.json'))
+        kept, removed = os.path.join(tmpdir, 'kept.mid'), os.path.join(tmpdir, 'removed.mid')
+        for filename in (kept, removed):
+            with open(filename, 'wb') as f:
+                f.write(b'abc')
+            config.get_sha(filename)
+        # a file on a drive that is not mounted right now
+        unmounted = os.path.join(tmpdir, 'unmounted', 'song.mid')
+        config._sha_cache[unmounted] = (0, 3, hashlib.sha1(b'abc').hexdigest())
+        os.remove(removed)
+        config.save()
+
+        # entries for deleted files are dropped when the config is next loaded
+        config = Config(config.config_file)
+        assert set(config._sha_cache) == {os.path.abspath(kept), unmounted}
+
+
+def test_songs_by_sha():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_file = os.path.join(tmpdir, 'config.json')
+        # older configs stored songs as a list
+        with open(config_file, 'w') as f:
+            f.write('{"songs": [{"sha": "abc", "speed": 50.0}, {"sha": "def"}, {"name": "no sha"}, {"sha": "abc", "speed": 70.0}]}')
+
+        config = Config(config_file)
+        assert set(config.songs_by_sha) == {'abc', 'def'}
+        song = config.songs_by_sha['abc']
+        assert song['speed'] == 50.0
+        assert song['zoom'] == 1.0
+        # defaults are not shared between songs
+        assert song['loops'] is not config.songs_by_sha['def']['loops']
+
+        # entries without a sha, or with a duplicate sha, are kept rather than dropped
+        assert config['legacy_songs'] == [{'name': 'no sha'}, {'sha': 'abc', 'speed': 70.0}]
+
+        # saved keyed by sha
+        config.save()
+        config = Config(config_file)
+        assert isinstance(config['songs'], dict)
+        assert config.songs_by_sha['abc']['speed'] == 50.0
+
+
+def test_load_error():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_file = os.path.join(tmpdir, 'config.json')
+        with open(config_file, 'w') as f:
+            f.write('not json')
+        defaults = copy.deepcopy(default_config)
+
+        # an unreadable config falls back to the defaults without modifying them
+        config = Config(config_file)
+        config.save()
+        assert config['search_paths'] == defaults['search_paths']
+        assert default_config == defaults
+
+
+def test_rehash_all():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = Config(os.path.join(tmpdir, 'config.json'))
+        files = []
+        for i in range(20):
+            filename = os.path.join(tmpdir, f'{i}.mid')
+            with open(filename, 'wb') as f:
+                f.write(str(i).encode() * 100)
+            files.append(filename)
+
+        # a missing file does not stop the others from being hashed
+        missing = os.path.join(tmpdir, 'missing.mid')
+        digests = config.rehash_all(files[:10] + [missing] + files[10:])
+        assert digests.pop(missing) is None
+        assert digests == {f: config.get_sha(f) for f in files}
+        assert digests[files[3]] == hashlib.sha1(b'3' * 100).hexdigest()
+
+        # results are saved with the config
+        assert len(Config(config.config_file)._sha_cache) == 20
@@ -0,0 +1,70 @@
+import os, sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import tempfile
+import mido
+import numpy as np
+from pianofalls.midi import load_midi, _ticks_to_seconds
+
+
+def write_midi(tracks, ticks_per_beat=480):
+    """Write a type 1 MIDI file containing the given lists of messages; return the file name"""
+    mid = mido.MidiFile(type=1, ticks_per_beat=ticks_per_beat)
+    for msgs in tracks:
+        track = mido.MidiTrack()
+        track.extend(msgs)
+        mid.tracks.append(track)
+    fh, filename = tempfile.mkstemp(suffix='.mid')
+    os.close(fh)
+    mid.save(filename)
+    return filename
+
+
+def test_ticks_to_seconds():
+    tpb = 480
+    tempo_ticks = np.array([960, 960, 1920])
+    tempos = np.array([250000, 1000000, 400000])
+    ticks = np.array([0, 100, 960, 1000, 1920, 5000])
+
+    # compare against stepping through tempo changes one at a time
+    expected = []
+    for t in ticks:
+        seconds = 0
+        last_tick = 0
+        tempo = 500000
+        for tt, new_tempo in zip(tempo_ticks, tempos):
+            if tt > t:
+                break
+            seconds += mido.tick2second(tt - last_tick, tpb, tempo)
+            last_tick = tt
+            tempo = new_tempo
+        expected.append(seconds + mido.tick2second(t - last_tick, tpb, tempo))
+
+    assert np.allclose(_ticks_to_seconds(ticks, tempo_ticks, tempos, tpb), expected)
+
+
+def test_load_midi():
+    filename = write_midi([
+        [
+            mido.MetaMessage('set_tempo', tempo=500000, time=0),
+            mido.MetaMessage('set_tempo', tempo=1000000, time=960),
+        ],
+        [
+            mido.Message('note_on', note=60, velocity=64, time=0),
+            mido.Message('note_off', note=60, velocity=0, time=480),
+            mido.Message('note_on', note=62, velocity=64, time=480),
+            # re-triggered note ends the previous one
+            mido.Message('note_on', note=62, velocity=64, time=480),
+            # note_on with velocity 0 is a note_off
+            mido.Message('note_on', note=62, velocity=0, time=480),
+        ],
+    ])
+    try:
+        song = load_midi(filename)
+    finally:
+        os.remove(filename)
+
+    notes = [(n.pitch.midi_note, n.start_time, n.duration) for n in song.notes]
+    assert np.allclose([n[0] for n in notes], [60, 62, 62])
+    assert np.allclose([n[1] for n in notes], [0, 1.0, 2.0])
+    assert np.allclose([n[2] for n in notes], [0.5, 1.0, 1.0])